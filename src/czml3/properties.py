@@ -10,7 +10,6 @@ from pydantic import (
     model_serializer,
     model_validator,
 )
-from w3lib.url import is_url, parse_data_uri
 
 from .base import BaseCZMLObject
 from .common import Deletable, Interpolatable
@@ -44,6 +43,9 @@ from .types import (
     get_color,
 )
 
+# Common prefixes that w3lib.url.is_url accepts, checked before falling back to w3lib
+URL_PREFIXES = ("https://", "http://", "file://")
+
 
 class HasAlignment(BaseModel):
     """A property that can be horizontally or vertically aligned."""
@@ -202,18 +204,13 @@ class Position(BaseCZMLObject, Interpolatable, Deletable):
     def checks(self):
         if self.delete:
             return self
+        # adding the booleans counts the given values without a generator
         if (
-            sum(
-                val is not None
-                for val in (
-                    self.cartesian,
-                    self.cartographicDegrees,
-                    self.cartographicRadians,
-                    self.cartesianVelocity,
-                )
-            )
-            != 1
-        ):
+            (self.cartesian is not None)
+            + (self.cartographicDegrees is not None)
+            + (self.cartographicRadians is not None)
+            + (self.cartesianVelocity is not None)
+        ) != 1:
             raise TypeError(
                 "One of cartesian, cartographicDegrees, cartographicRadians or reference must be given"
             )
@@ -550,7 +547,7 @@ class RectangleCoordinates(BaseCZMLObject, Interpolatable, Deletable):
     def checks(self):
         if self.delete:
             return self
-        if sum(val is not None for val in (self.wsen, self.wsenDegrees)) != 1:
+        if (self.wsen is None) == (self.wsenDegrees is None):
             raise TypeError("One of wsen or wsenDegrees must be given")
         return self
 
@@ -786,6 +783,13 @@ class Uri(BaseCZMLObject, Deletable):
     @field_validator("uri")
     @classmethod
     def _check_uri(cls, value: str):
+        if value.startswith(URL_PREFIXES):
+            return value
+
+        # w3lib pulls in urllib.request, so only import it when the prefixes miss
+        from w3lib.url import is_url, parse_data_uri
+
+        # is_url only looks at the text before "://", so a bare "http" passes too
         if is_url(value):
             return value
         try:
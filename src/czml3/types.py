@@ -1,10 +1,11 @@
 import datetime as dt
 import re
 import sys
+from functools import lru_cache
 from typing import Any
 
-from dateutil.parser import isoparse as parse_iso_date
 from pydantic import (
+    ConfigDict,
     Field,
     field_validator,
     model_serializer,
@@ -21,23 +22,43 @@ else:
 
 TYPE_MAPPING = {bool: "boolean"}
 
+REFERENCE_RE = re.compile(r"^.+#.+$")
+
+
+@lru_cache(maxsize=1024)
+def _parse_color_string(color: str) -> tuple[int, int, int, int]:
+    # Documents tend to reuse a small palette, so cache the parsed strings.
+    # get_color copies the result into a fresh list for each caller.
+    n = int(color.rsplit("#")[-1], 16)
+    if n >> 32 != 0:
+        raise TypeError("RGBA string not valid")
+    if n > 0xFFFFFF:
+        return (
+            (n & 0xFF000000) >> 24,
+            (n & 0x00FF0000) >> 16,
+            (n & 0x0000FF00) >> 8,
+            (n & 0x000000FF) >> 0,
+        )
+    else:
+        return (
+            (n & 0xFF0000) >> 16,
+            (n & 0x00FF00) >> 8,
+            (n & 0x0000FF) >> 0,
+            0xFF,
+        )
+
 
 def get_color(color) -> list[float] | None:
     """Determines if the input is a valid color"""
-    if color is None or (
-        isinstance(color, list)
-        and all(issubclass(type(v), float) for v in color)
-        and len(color) == 4
-        and (all(0 <= v <= 255 for v in color) or all(0 <= v <= 1 for v in color))
-    ):
+    if color is None:
         return color
-    elif (
-        isinstance(color, list)
-        and all(issubclass(type(v), float) for v in color)
-        and len(color) == 3
-        and all(0 <= v <= 255 for v in color)
-    ):
-        return color + [255.0]
+    elif isinstance(color, list):
+        # RGB or RGBA floats, checked in a single pass
+        n = len(color)
+        if (n == 3 or n == 4) and all(
+            issubclass(type(v), float) and 0 <= v <= 255 for v in color
+        ):
+            return color if n == 4 else color + [255.0]
     # rgbf or rgbaf
     # if (
     #     isinstance(color, list)
@@ -46,77 +67,66 @@ def get_color(color) -> list[float] | None:
     #     and not all(0 <= v <= 1 for v in color)
     # ):
     #     raise TypeError("RGBF or RGBAF values must be between 0 and 1")
-    elif (
-        isinstance(color, list)
-        and all(issubclass(type(v), float) for v in color)
-        and len(color) == 3
-        and all(0 <= v <= 1 for v in color)
-    ):
-        return color + [1.0]
     # Hexadecimal RGBA
     # elif issubclass(type(color), int) and not (0 <= color <= 0xFFFFFFFF):
     #     raise TypeError("Hexadecimal RGBA not valid")
-    elif (
-        issubclass(type(color), int) and (0 <= color <= 0xFFFFFFFF) and color > 0xFFFFFF
-    ):
-        return [
-            (color & 0xFF000000) >> 24,
-            (color & 0x00FF0000) >> 16,
-            (color & 0x0000FF00) >> 8,
-            (color & 0x000000FF) >> 0,
-        ]
-    elif issubclass(type(color), int) and (0 <= color <= 0xFFFFFFFF):
-        return [
-            (color & 0xFF0000) >> 16,
-            (color & 0x00FF00) >> 8,
-            (color & 0x0000FF) >> 0,
-            0xFF,
-        ]
+    # a negative int shifts to -1, so one shift also rejects those
+    elif issubclass(type(color), int) and color >> 32 == 0:
+        # unpack the channels with a single C call instead of masks and shifts
+        if color > 0xFFFFFF:
+            return list(color.to_bytes(4, "big"))
+        else:
+            return [*color.to_bytes(3, "big"), 0xFF]
     # RGBA string
     elif isinstance(color, str):
-        n = int(color.rsplit("#")[-1], 16)
-        if not (0 <= n <= 0xFFFFFFFF):
-            raise TypeError("RGBA string not valid")
-        if n > 0xFFFFFF:
-            return [
-                (n & 0xFF000000) >> 24,
-                (n & 0x00FF0000) >> 16,
-                (n & 0x0000FF00) >> 8,
-                (n & 0x000000FF) >> 0,
-            ]
-        else:
-            return [
-                (n & 0xFF0000) >> 16,
-                (n & 0x00FF00) >> 8,
-                (n & 0x0000FF) >> 0,
-                0xFF,
-            ]
+        return list(_parse_color_string(color))
     raise TypeError("Colour type not supported")
 
 
 def check_reference(r):
     if r is None:
         return
-    elif re.search(r"^.+#.+$", r) is None:
+    elif REFERENCE_RE.match(r) is None:
         raise TypeError(
             "Invalid reference string format. Input must be of the form id#property"
         )
 
 
+def check_time_tagged_values(values, num_coords):
+    """Checks values are either one sample or time-tagged samples."""
+    n = len(values)
+    if n != num_coords and n % (num_coords + 1) != 0:
+        raise TypeError(
+            f"Input values must have either {num_coords} or N * {num_coords + 1} values, "
+            "where N is the number of time-tagged samples."
+        )
+
+
+@lru_cache(maxsize=4096)
+def _check_iso_string(value: str) -> None:
+    # Documents repeat the same timestamps a lot, so remember the ones that passed.
+    # dateutil.parser is slow to import, so only load it when needed
+    from dateutil.parser import isoparse
+
+    isoparse(value)
+
+
 def format_datetime_like(dt_object):
     if dt_object is None:
         result = dt_object
 
     elif isinstance(dt_object, str):
-        try:
-            parse_iso_date(dt_object)
-        except Exception:
-            raise
-        else:
-            result = dt_object
+        _check_iso_string(dt_object)
+        result = dt_object
 
     elif isinstance(dt_object, dt.datetime):
-        result = dt_object.strftime(ISO8601_FORMAT_Z)
+        # Same as strftime(ISO8601_FORMAT_Z), which does not zero-pad years
+        # before 1000 on every platform, without parsing a format string
+        result = (
+            f"{dt_object.year:04d}-{dt_object.month:02d}-{dt_object.day:02d}"
+            f"T{dt_object.hour:02d}:{dt_object.minute:02d}:{dt_object.second:02d}"
+            f".{dt_object.microsecond:06d}Z"
+        )
 
     else:
         result = dt_object.strftime(ISO8601_FORMAT_Z)
@@ -148,23 +158,15 @@ class RgbafValue(BaseCZMLObject):
     @model_validator(mode="after")
     def _check_values(self) -> Self:
         num_coords = 4
-        if not (
-            len(self.values) == num_coords or len(self.values) % (num_coords + 1) == 0
-        ):
-            raise TypeError(
-                f"Input values must have either {num_coords} or N * {num_coords + 1} values, "
-                "where N is the number of time-tagged samples."
-            )
+        check_time_tagged_values(self.values, num_coords)
         if len(self.values) == num_coords:
-            if not all(0 <= val <= 1 for val in self.values):
-                raise TypeError("Color values must be floats in the range 0-1.")
-
+            colors = self.values
         else:
-            for i in range(0, len(self.values), num_coords + 1):
-                v = self.values[i + 1 : i + num_coords + 1]
-
-                if not all(0 <= val <= 1 for val in v):
-                    raise TypeError("Color values must be floats in the range 0-1.")
+            # Drop the time tags so all components are checked in one pass
+            colors = list(self.values)
+            del colors[:: num_coords + 1]
+        if not all(0 <= val <= 1 for val in colors):
+            raise TypeError("Color values must be floats in the range 0-1.")
         return self
 
     @model_serializer
@@ -188,25 +190,15 @@ class RgbaValue(BaseCZMLObject):
     @model_validator(mode="after")
     def _check_values(self) -> Self:
         num_coords = 4
-        if not (
-            len(self.values) == num_coords or len(self.values) % (num_coords + 1) == 0
-        ):
-            raise TypeError(
-                f"Input values must have either {num_coords} or N * {num_coords + 1} values, "
-                "where N is the number of time-tagged samples."
-            )
-
-        if len(self.values) == num_coords and not all(
-            isinstance(val, float) and 0 <= val <= 255 for val in self.values
-        ):
-            raise TypeError("Color values must be integers in the range 0-255.")
-
+        check_time_tagged_values(self.values, num_coords)
+        if len(self.values) == num_coords:
+            colors = self.values
         else:
-            for i in range(0, len(self.values), num_coords + 1):
-                v = self.values[i + 1 : i + num_coords + 1]
-
-                if not all(isinstance(val, float) and 0 <= val <= 255 for val in v):
-                    raise TypeError("Color values must be integers in the range 0-255.")
+            # Drop the time tags so all components are checked in one pass
+            colors = list(self.values)
+            del colors[:: num_coords + 1]
+        if not all(isinstance(val, float) and 0 <= val <= 255 for val in colors):
+            raise TypeError("Color values must be integers in the range 0-255.")
         return self
 
     @model_serializer
@@ -253,13 +245,7 @@ class Cartesian3Value(BaseCZMLObject):
         if self.values is None:
             return self
         num_coords = 3
-        if not (
-            len(self.values) == num_coords or len(self.values) % (num_coords + 1) == 0
-        ):
-            raise TypeError(
-                f"Input values must have either {num_coords} or N * {num_coords + 1} values, "
-                "where N is the number of time-tagged samples."
-            )
+        check_time_tagged_values(self.values, num_coords)
         return self
 
     @model_serializer
@@ -286,13 +272,7 @@ class Cartesian2Value(BaseCZMLObject):
         if self.values is None:
             return self
         num_coords = 2
-        if not (
-            len(self.values) == num_coords or len(self.values) % (num_coords + 1) == 0
-        ):
-            raise TypeError(
-                f"Input values must have either {num_coords} or N * {num_coords + 1} values, "
-                "where N is the number of time-tagged samples."
-            )
+        check_time_tagged_values(self.values, num_coords)
         return self
 
     @model_serializer
@@ -320,13 +300,7 @@ class CartographicRadiansValue(BaseCZMLObject):
         if self.values is None:
             return self
         num_coords = 3
-        if not (
-            len(self.values) == num_coords or len(self.values) % (num_coords + 1) == 0
-        ):
-            raise TypeError(
-                f"Input values must have either {num_coords} or N * {num_coords + 1} values, "
-                "where N is the number of time-tagged samples."
-            )
+        check_time_tagged_values(self.values, num_coords)
         return self
 
     @model_serializer
@@ -354,13 +328,7 @@ class CartographicDegreesValue(BaseCZMLObject):
         if self.values is None:
             return self
         num_coords = 3
-        if not (
-            len(self.values) == num_coords or len(self.values) % (num_coords + 1) == 0
-        ):
-            raise TypeError(
-                f"Input values must have either {num_coords} or N * {num_coords + 1} values, "
-                "where N is the number of time-tagged samples."
-            )
+        check_time_tagged_values(self.values, num_coords)
         return self
 
     @model_serializer
@@ -459,13 +427,7 @@ class NearFarScalarValue(BaseCZMLObject):
     @model_validator(mode="after")
     def _check_values(self) -> Self:
         num_coords = 4
-        if not (
-            len(self.values) == num_coords or len(self.values) % (num_coords + 1) == 0
-        ):
-            raise TypeError(
-                f"Input values must have either {num_coords} or N * {num_coords + 1} values, "
-                "where N is the number of time-tagged samples."
-            )
+        check_time_tagged_values(self.values, num_coords)
         return self
 
     @model_serializer
@@ -492,16 +454,24 @@ class TimeInterval(BaseCZMLObject):
 class IntervalValue(BaseCZMLObject):
     """Value over some interval."""
 
+    # Keep reassigned times formatted, so the serializer can emit them as is
+    model_config = ConfigDict(validate_assignment=True)
+
     start: str | dt.datetime
     end: str | dt.datetime
     value: Any = Field(default=None)
 
+    @field_validator("start", "end")
+    @classmethod
+    def format_time(cls, time):
+        return format_datetime_like(time)
+
     @model_serializer
     def custom_serializer(self) -> dict[str, Any]:
         obj_dict = {
-            "interval": TimeInterval(start=self.start, end=self.end).model_dump(
-                exclude_none=True
-            )
+            # start and end were already formatted by the field validator,
+            # so this is what TimeInterval would serialize to
+            "interval": f"{self.start}/{self.end}"
         }
 
         if isinstance(self.value, BaseCZMLObject):
@@ -557,11 +527,19 @@ class UnitQuaternionValue(BaseCZMLObject):
 class EpochValue(BaseCZMLObject):
     """A value representing a time epoch."""
 
+    # Keep reassigned values formatted, so the serializer can emit them as is
+    model_config = ConfigDict(validate_assignment=True)
+
     value: str | dt.datetime
 
+    @field_validator("value")
+    @classmethod
+    def format_time(cls, time):
+        return format_datetime_like(time)
+
     @model_serializer
     def custom_serializer(self):
-        return {"epoch": format_datetime_like(self.value)}
+        return {"epoch": self.value}
 
 
 class NumberValue(BaseCZMLObject):
@@ -68,6 +68,16 @@ from czml3.types import (
     format_datetime_like,
 )
 
+EPOCH = dt.datetime(2019, 6, 11, 12, 26, 58, tzinfo=dt.timezone.utc)
+
+
+@pytest.fixture(scope="module")
+def march_april_2019_interval():
+    return TimeInterval(
+        start=dt.datetime(2019, 3, 20, 12, tzinfo=dt.timezone.utc),
+        end=dt.datetime(2019, 4, 20, 12, tzinfo=dt.timezone.utc),
+    )
+
 
 def test_box():
     expected_result = """{
@@ -179,7 +189,8 @@ def test_polyline():
     assert str(pol) == expected_result
 
 
-def test_material_solid_color():
+@pytest.mark.parametrize("material_class", [Material, PolylineMaterial])
+def test_material_solid_color(material_class):
     expected_result = """{
     "solidColor": {
         "color": {
@@ -192,14 +203,11 @@ def test_material_solid_color():
         }
     }
 }"""
-    mat = Material(solidColor=SolidColorMaterial(color=Color(rgba=[200, 100, 30])))
-
-    assert str(mat) == expected_result
-
-    pol_mat = PolylineMaterial(
+    mat = material_class(
         solidColor=SolidColorMaterial(color=Color(rgba=[200, 100, 30]))
     )
-    assert str(pol_mat) == expected_result
+
+    assert str(mat) == expected_result
 
 
 def test_arrowmaterial_color():
@@ -321,10 +329,7 @@ def test_positionlist_epoch():
         30.0
     ]
 }"""
-    p = PositionList(
-        epoch=dt.datetime(2019, 6, 11, 12, 26, 58, tzinfo=dt.timezone.utc),
-        cartographicDegrees=[200, 100, 30],
-    )
+    p = PositionList(epoch=EPOCH, cartographicDegrees=[200, 100, 30])
     assert str(p) == expected_result
 
 
@@ -357,6 +362,14 @@ def test_colors_rgbaf():
     Color(rgbaf=[0.127568, 0.566949, 0.550556, 1.0])
 
 
+def test_colors_from_same_string_are_independent():
+    color1 = Color(rgba="#FF3223")
+    color2 = Color(rgba="#FF3223")
+    color1.rgba[0] = 0  # type: ignore
+
+    assert color2.rgba == [255, 50, 35, 255]
+
+
 def test_color_invalid_colors_rgba():
     with pytest.raises(TypeError):
         Color(rgba=[256, 204, 0, 55])
@@ -403,59 +416,35 @@ def test_color_invalid_colors_rgbaf():
         Color(rgbaf=[0.127568, 0.566949, 0.550556, 1.0, 3.0])
 
 
-def test_material_image():
-    expected_result = """{
-    "image": {
-        "image": "https://site.com/image.png",
-        "repeat": [
-            2,
-            2
-        ],
-        "color": {
-            "rgba": [
-                200.0,
-                100.0,
-                30.0,
-                255.0
-            ]
-        }
-    }
-}"""
-
-    mat = Material(
-        image=ImageMaterial(
-            image=Uri(uri="https://site.com/image.png"),
-            repeat=[2, 2],
-            color=Color(rgba=[200, 100, 30]),
-        )
-    )
-    assert str(mat) == expected_result
-
-
-def test_material_image_uri():
-    expected_result = """{
-    "image": {
-        "image": "data:image/gif;base64,R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7",
+@pytest.mark.parametrize(
+    "uri",
+    [
+        "https://site.com/image.png",
+        "data:image/gif;base64,R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7",
+    ],
+)
+def test_material_image(uri):
+    expected_result = f"""{{
+    "image": {{
+        "image": "{uri}",
         "repeat": [
             2,
             2
         ],
-        "color": {
+        "color": {{
             "rgba": [
                 200.0,
                 100.0,
                 30.0,
                 255.0
             ]
-        }
-    }
-}"""
+        }}
+    }}
+}}"""
 
     mat = Material(
         image=ImageMaterial(
-            image=Uri(
-                uri="data:image/gif;base64,R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7"
-            ),
+            image=Uri(uri=uri),
             repeat=[2, 2],
             color=Color(rgba=[200, 100, 30]),
         )
@@ -615,9 +604,7 @@ def test_position_with_delete_has_nothing_else():
 
 
 def test_position_has_given_epoch():
-    expected_epoch = format_datetime_like(
-        dt.datetime(2019, 6, 11, 12, 26, 58, tzinfo=dt.timezone.utc)
-    )
+    expected_epoch = format_datetime_like(EPOCH)
 
     pos = Position(epoch=expected_epoch, cartesian=[])
 
@@ -625,9 +612,7 @@ def test_position_has_given_epoch():
 
 
 def test_positionlist_has_given_epoch():
-    expected_epoch = format_datetime_like(
-        dt.datetime(2019, 6, 11, 12, 26, 58, tzinfo=dt.timezone.utc)
-    )
+    expected_epoch = format_datetime_like(EPOCH)
 
     pos = PositionList(epoch=expected_epoch, cartesian=[])
 
@@ -807,6 +792,20 @@ def test_bad_uri_raises_error():
     assert "uri must be a URL or a data URI" in excinfo.exconly()
 
 
+@pytest.mark.parametrize(
+    "uri",
+    [
+        "https://example.com/image.png",
+        "http://example.com/image.png",
+        "file:///tmp/image.png",
+        "http",
+        "data:image/png;base64,iVBORw0KGgo=",
+    ],
+)
+def test_uri_accepts_urls_and_data_uris(uri):
+    assert Uri(uri=uri).uri == uri
+
+
 def test_ellipsoid():
     expected_result = """{
     "radii": {
@@ -917,7 +916,7 @@ def test_polygon_with_hole():
     assert str(p) == expected_result
 
 
-def test_polygon_interval():
+def test_polygon_interval(march_april_2019_interval):
     """This only tests one interval"""
 
     expected_result = """{
@@ -930,12 +929,10 @@ def test_polygon_interval():
         "interval": "2019-03-20T12:00:00.000000Z/2019-04-20T12:00:00.000000Z"
     }
 }"""
-    t = TimeInterval(
-        start=dt.datetime(2019, 3, 20, 12, tzinfo=dt.timezone.utc),
-        end=dt.datetime(2019, 4, 20, 12, tzinfo=dt.timezone.utc),
-    )
     poly = Polygon(
-        positions=PositionList(cartographicDegrees=[10.0, 20.0, 0.0], interval=t)
+        positions=PositionList(
+            cartographicDegrees=[10.0, 20.0, 0.0], interval=march_april_2019_interval
+        )
     )
     assert str(poly) == expected_result
 
@@ -992,7 +989,7 @@ def test_polygon_outline():
     assert str(poly) == expected_result
 
 
-def test_polygon_interval_with_position():
+def test_polygon_interval_with_position(march_april_2019_interval):
     """This only tests one interval"""
 
     expected_result = """{
@@ -1005,12 +1002,10 @@ def test_polygon_interval_with_position():
         "interval": "2019-03-20T12:00:00.000000Z/2019-04-20T12:00:00.000000Z"
     }
 }"""
-    t = TimeInterval(
-        start=dt.datetime(2019, 3, 20, 12, tzinfo=dt.timezone.utc),
-        end=dt.datetime(2019, 4, 20, 12, tzinfo=dt.timezone.utc),
-    )
     poly = Polygon(
-        positions=Position(cartographicDegrees=[10.0, 20.0, 0.0], interval=t)
+        positions=Position(
+            cartographicDegrees=[10.0, 20.0, 0.0], interval=march_april_2019_interval
+        )
     )
     assert str(poly) == expected_result
 
@@ -1040,47 +1035,54 @@ def test_tileset():
     assert str(tileset) == expected_result
 
 
-def test_check_classes_with_references():
-    assert (
-        str(ViewFrom(cartesian=[0, 0], reference="this#that"))
-        == """{
+@pytest.mark.parametrize(
+    "property_class, kwargs, expected_result",
+    [
+        (
+            ViewFrom,
+            {"cartesian": [0, 0]},
+            """{
     "cartesian": [
         0.0,
         0.0
     ],
     "reference": "this#that"
-}"""
-    )
-    assert (
-        str(EllipsoidRadii(cartesian=[0, 0], reference="this#that"))
-        == """{
+}""",
+        ),
+        (
+            EllipsoidRadii,
+            {"cartesian": [0, 0]},
+            """{
     "cartesian": [
         0.0,
         0.0
     ],
     "reference": "this#that"
-}"""
-    )
-    assert (
-        str(ArcType(arcType=ArcTypes.GEODESIC, reference="this#that"))
-        == """{
+}""",
+        ),
+        (
+            ArcType,
+            {"arcType": ArcTypes.GEODESIC},
+            """{
     "arcType": "GEODESIC",
     "reference": "this#that"
-}"""
-    )
-    assert (
-        str(Position(cartesian=[0, 0], reference="this#that"))
-        == """{
+}""",
+        ),
+        (
+            Position,
+            {"cartesian": [0, 0]},
+            """{
     "cartesian": [
         0.0,
         0.0
     ],
     "reference": "this#that"
-}"""
-    )
-    assert (
-        str(Orientation(unitQuaternion=[0, 0, 0, 0], reference="this#that"))
-        == """{
+}""",
+        ),
+        (
+            Orientation,
+            {"unitQuaternion": [0, 0, 0, 0]},
+            """{
     "unitQuaternion": [
         0.0,
         0.0,
@@ -1088,118 +1090,113 @@ def test_check_classes_with_references():
         0.0
     ],
     "reference": "this#that"
-}"""
-    )
-    assert (
-        str(NearFarScalar(nearFarScalar=[0, 0], reference="this#that"))
-        == """{
+}""",
+        ),
+        (
+            NearFarScalar,
+            {"nearFarScalar": [0, 0]},
+            """{
     "nearFarScalar": [
         0.0,
         0.0
     ],
     "reference": "this#that"
-}"""
-    )
-    assert (
-        str(CornerType(cornerType=CornerTypes.BEVELED, reference="this#that"))
-        == """{
+}""",
+        ),
+        (
+            CornerType,
+            {"cornerType": CornerTypes.BEVELED},
+            """{
     "cornerType": "BEVELED",
     "reference": "this#that"
-}"""
-    )
-    assert (
-        str(
-            ColorBlendMode(
-                colorBlendMode=ColorBlendModes.HIGHLIGHT, reference="this#that"
-            )
-        )
-        == """{
+}""",
+        ),
+        (
+            ColorBlendMode,
+            {"colorBlendMode": ColorBlendModes.HIGHLIGHT},
+            """{
     "colorBlendMode": "HIGHLIGHT",
     "reference": "this#that"
-}"""
-    )
-    assert (
-        str(
-            HeightReference(
-                heightReference=HeightReferences.NONE, reference="this#that"
-            )
-        )
-        == """{
+}""",
+        ),
+        (
+            HeightReference,
+            {"heightReference": HeightReferences.NONE},
+            """{
     "heightReference": "NONE",
     "reference": "this#that"
-}"""
-    )
-    assert (
-        str(EyeOffset(cartesian=[0, 0], reference="this#that"))
-        == """{
+}""",
+        ),
+        (
+            EyeOffset,
+            {"cartesian": [0, 0]},
+            """{
     "cartesian": [
         0.0,
         0.0
     ],
     "reference": "this#that"
-}"""
-    )
-    assert (
-        str(RectangleCoordinates(wsen=[0, 0], reference="this#that"))
-        == """{
+}""",
+        ),
+        (
+            RectangleCoordinates,
+            {"wsen": [0, 0]},
+            """{
     "wsen": [
         0.0,
         0.0
     ],
     "reference": "this#that"
-}"""
-    )
-    assert (
-        str(
-            BoxDimensions(
-                cartesian=Cartesian3Value(values=[0, 0, 1]), reference="this#that"
-            )
-        )
-        == """{
+}""",
+        ),
+        (
+            BoxDimensions,
+            {"cartesian": Cartesian3Value(values=[0, 0, 1])},
+            """{
     "cartesian": [
         0.0,
         0.0,
         1.0
     ],
     "reference": "this#that"
-}"""
-    )
-    assert (
-        str(
-            DistanceDisplayCondition(
-                distanceDisplayCondition=DistanceDisplayConditionValue(
+}""",
+        ),
+        (
+            DistanceDisplayCondition,
+            {
+                "distanceDisplayCondition": DistanceDisplayConditionValue(
                     values=[0, 1, 2]
-                ),
-                reference="this#that",
-            )
-        )
-        == """{
+                )
+            },
+            """{
     "distanceDisplayCondition": [
         0.0,
         1.0,
         2.0
     ],
     "reference": "this#that"
-}"""
-    )
-    assert (
-        str(
-            ClassificationType(
-                classificationType=ClassificationTypes.BOTH, reference="this#that"
-            )
-        )
-        == """{
+}""",
+        ),
+        (
+            ClassificationType,
+            {"classificationType": ClassificationTypes.BOTH},
+            """{
     "classificationType": "BOTH",
     "reference": "this#that"
-}"""
-    )
-    assert (
-        str(ShadowMode(shadowMode=ShadowModes.CAST_ONLY, reference="this#that"))
-        == """{
+}""",
+        ),
+        (
+            ShadowMode,
+            {"shadowMode": ShadowModes.CAST_ONLY},
+            """{
     "shadowMode": "CAST_ONLY",
     "reference": "this#that"
-}"""
-    )
+}""",
+        ),
+    ],
+)
+def test_check_classes_with_references(property_class, kwargs, expected_result):
+    assert str(property_class(**kwargs, reference="this#that")) == expected_result
 
 
 def test_rectangle_coordinates_delete():
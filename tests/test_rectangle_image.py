@@ -1,21 +1,20 @@
 import base64
 import os
 import tempfile
+from pathlib import Path
 
 import pytest
 
 from czml3 import Document, Packet, Preamble
 from czml3.properties import ImageMaterial, Material, Rectangle, RectangleCoordinates
 
+SMILEY_PNG = Path(__file__).with_name("smiley.png")
 
-@pytest.fixture
-def image():
-    filename = os.path.join(os.path.dirname(os.path.realpath(__file__)), "smiley.png")
-    with open(filename, "rb") as fp:
-        data = fp.read()
 
-    base64_data = base64.b64encode(data)
-    return base64_data.decode("utf-8")
+@pytest.fixture(scope="session")
+def image_data_uri():
+    data = SMILEY_PNG.read_bytes()
+    return "data:image/png;base64," + base64.b64encode(data).decode("ascii")
 
 
 def test_rectangle_coordinates_invalid_if_nothing_given():
@@ -25,67 +24,53 @@ def test_rectangle_coordinates_invalid_if_nothing_given():
     assert "One of wsen or wsenDegrees must be given" in excinfo.exconly()
 
 
-def test_packet_rectangles(image):
-    wsen = [20.0, 40.0, 21.0, 41.0]
+@pytest.fixture(scope="module")
+def rectangle_packet(image_data_uri):
+    return Packet(
+        id="id_00",
+        rectangle=Rectangle(
+            coordinates=RectangleCoordinates(wsenDegrees=[20, 40, 21, 41]),
+            fill=True,
+            material=Material(
+                image=ImageMaterial(
+                    transparent=True,
+                    repeat=None,
+                    image=image_data_uri,
+                ),
+            ),
+        ),
+    )
+
 
-    expected_result = """{{
+def test_packet_rectangles(rectangle_packet, image_data_uri):
+    expected_result = f"""{{
     "id": "id_00",
     "rectangle": {{
         "coordinates": {{
             "wsenDegrees": [
-                {},
-                {},
-                {},
-                {}
+                20.0,
+                40.0,
+                21.0,
+                41.0
             ]
         }},
         "fill": true,
         "material": {{
             "image": {{
-                "image": "data:image/png;base64,{}",
+                "image": "{image_data_uri}",
                 "transparent": true
             }}
         }}
     }}
-}}""".format(*wsen, image)
-
-    rectangle_packet = Packet(
-        id="id_00",
-        rectangle=Rectangle(
-            coordinates=RectangleCoordinates(wsenDegrees=wsen),
-            fill=True,
-            material=Material(
-                image=ImageMaterial(
-                    transparent=True,
-                    repeat=None,
-                    image="data:image/png;base64," + image,
-                ),
-            ),
-        ),
-    )
+}}"""
 
     assert str(rectangle_packet) == expected_result
 
 
-def test_make_czml_png_rectangle_file(image):
-    rectangle_packet = Packet(
-        id="id_00",
-        rectangle=Rectangle(
-            coordinates=RectangleCoordinates(wsenDegrees=[20, 40, 21, 41]),
-            fill=True,
-            material=Material(
-                image=ImageMaterial(
-                    transparent=True,
-                    repeat=None,
-                    image="data:image/png;base64," + image,
-                ),
-            ),
-        ),
-    )
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".czml") as out_file:
-        out_file.write(str(Document(packets=[Preamble(), rectangle_packet])))
-        exists = os.path.isfile(out_file.name)
+def test_make_czml_png_rectangle_file(rectangle_packet):
+    document = Document(packets=[Preamble(), rectangle_packet])
+    with tempfile.NamedTemporaryFile(suffix=".czml") as out_file:
+        out_file.write(str(document).encode("utf-8"))
+        out_file.flush()
 
-        # TODO: Should we be testing something else?
-        assert exists
+        assert os.path.getsize(out_file.name) > 0
@@ -1,6 +1,5 @@
 import datetime as dt
 
-import astropy.time
 import pytest
 from pydantic import ValidationError
 
@@ -24,6 +23,7 @@ from czml3.types import (
     UnitQuaternionValue,
     check_reference,
     format_datetime_like,
+    get_color,
 )
 
 
@@ -146,46 +146,56 @@ def test_font_property_value():
     assert font.font == expected_result
 
 
-def test_bad_rgba_size_values_raises_error():
-    with pytest.raises(TypeError) as excinfo:
-        RgbaValue(values=[0, 0, 255])
-
-    assert "Input values must have either 4 or N * 5 values, " in excinfo.exconly()
-
-
-def test_bad_rgba_4_values_raises_error():
-    with pytest.raises(TypeError) as excinfo:
-        RgbaValue(values=[256, 0, 0, 255])
-
-    assert "Color values must be integers in the range 0-255." in excinfo.exconly()
-
-
-def test_bad_rgba_5_color_values_raises_error():
-    with pytest.raises(TypeError) as excinfo:
-        RgbaValue(values=[0, 0.1, 0.3, 0.3, 256])
-
-    assert "Color values must be integers in the range 0-255." in excinfo.exconly()
-
-
-def test_bad_rgbaf_size_values_raises_error():
-    with pytest.raises(TypeError) as excinfo:
-        RgbafValue(values=[0, 0, 0.1])
-
-    assert "Input values must have either 4 or N * 5 values, " in excinfo.exconly()
-
-
-def test_bad_rgbaf_4_values_raises_error():
-    with pytest.raises(TypeError) as excinfo:
-        RgbafValue(values=[0.3, 0, 0, 1.4])
-
-    assert "Color values must be floats in the range 0-1." in excinfo.exconly()
-
-
-def test_bad_rgbaf_5_color_values_raises_error():
+@pytest.mark.parametrize(
+    "value_class, values, message",
+    [
+        (
+            RgbaValue,
+            [0, 0, 255],
+            "Input values must have either 4 or N * 5 values, ",
+        ),
+        (
+            RgbaValue,
+            [256, 0, 0, 255],
+            "Color values must be integers in the range 0-255.",
+        ),
+        (
+            RgbaValue,
+            [0, 0.1, 0.3, 0.3, 256],
+            "Color values must be integers in the range 0-255.",
+        ),
+        (
+            RgbaValue,
+            [0, 1, 2, 3, 4, 1, 5, 6, 7, 256],
+            "Color values must be integers in the range 0-255.",
+        ),
+        (
+            RgbafValue,
+            [0, 0, 0.1],
+            "Input values must have either 4 or N * 5 values, ",
+        ),
+        (
+            RgbafValue,
+            [0.3, 0, 0, 1.4],
+            "Color values must be floats in the range 0-1.",
+        ),
+        (
+            RgbafValue,
+            [0, 0.1, 0.3, 0.3, 255],
+            "Color values must be floats in the range 0-1.",
+        ),
+        (
+            RgbafValue,
+            [0, 0.1, 0.2, 0.3, 0.4, 1, 0.5, 0.6, 0.7, 1.5],
+            "Color values must be floats in the range 0-1.",
+        ),
+    ],
+)
+def test_bad_color_values_raises_error(value_class, values, message):
     with pytest.raises(TypeError) as excinfo:
-        RgbafValue(values=[0, 0.1, 0.3, 0.3, 255])
+        value_class(values=values)
 
-    assert "Color values must be floats in the range 0-1." in excinfo.exconly()
+    assert message in excinfo.exconly()
 
 
 def test_default_time_interval():
@@ -200,6 +210,20 @@ def test_bad_time_raises_error():
         format_datetime_like("2019/01/01")
 
 
+@pytest.mark.parametrize(
+    "time",
+    [
+        "2019-01-01T12:00:00 Z",
+        "2019-01-01T12:00:00.Z",
+        "2019-01-01T12:00:00 +00:00",
+        "2019-01-01T12:00:00.000000 -0500",
+    ],
+)
+def test_malformed_iso_time_raises_error(time):
+    with pytest.raises(ValueError):
+        format_datetime_like(time)
+
+
 def test_interval_value():
     start = "2019-01-01T12:00:00.000000Z"
     end = "2019-09-02T21:59:59.000000Z"
@@ -255,7 +279,21 @@ def test_epoch_value():
     )
 
     with pytest.raises(ValueError):
-        str(EpochValue(value="test"))
+        EpochValue(value="test")
+
+    assert EpochValue(value=dt.datetime(2019, 1, 1, 12)).value == epoch
+
+    epoch_value = EpochValue(value=epoch)
+    epoch_value.value = dt.datetime(2020, 1, 1)
+    assert (
+        str(epoch_value)
+        == """{
+    "epoch": "2020-01-01T00:00:00.000000Z"
+}"""
+    )
+
+    with pytest.raises(ValueError):
+        epoch_value.value = "test"
 
 
 @pytest.mark.xfail(reason="NumberValue class requires further explanaition")
@@ -293,8 +331,9 @@ def test_numbers_value():
 def test_astropy_time_retains_input_format():
     # It would be nice to recover the input format,
     # but it's difficult without conditionally depending on Astropy
+    astropy_time = pytest.importorskip("astropy.time")
     expected_result = "2012-03-15T10:16:06.97400000000198Z"
-    time = astropy.time.Time(expected_result)
+    time = astropy_time.Time(expected_result)
 
     result = format_datetime_like(time)
 
@@ -302,8 +341,9 @@ def test_astropy_time_retains_input_format():
 
 
 def test_astropy_time_format():
+    astropy_time = pytest.importorskip("astropy.time")
     expected_result = "2012-03-15T10:16:06.974Z"
-    time = astropy.time.Time("2012-03-15T10:16:06.97400000000198Z")
+    time = astropy_time.Time("2012-03-15T10:16:06.97400000000198Z")
 
     result = format_datetime_like(time)
 
@@ -328,34 +368,11 @@ def test_quaternion_value():
     assert str(result) == expected_result
 
 
-def test_cartographic_radians_value():
-    result = CartographicRadiansValue(values=[0, 0, 0, 1])
-    assert (
-        str(result)
-        == """[
-    0.0,
-    0.0,
-    0.0,
-    1.0
-]"""
-    )
-    result = CartographicRadiansValue(values=[0, 0, 1])
-    assert (
-        str(result)
-        == """[
-    0.0,
-    0.0,
-    1.0
-]"""
-    )
-    result = CartographicRadiansValue()
-    assert str(result) == """[]"""
-    with pytest.raises(TypeError):
-        CartographicRadiansValue(values=[0, 0, 1, 1, 1, 1])
-
-
-def test_cartographic_degrees_value():
-    result = CartographicDegreesValue(values=[0, 0, 0, 1])
+@pytest.mark.parametrize(
+    "value_class", [CartographicRadiansValue, CartographicDegreesValue]
+)
+def test_cartographic_value(value_class):
+    result = value_class(values=[0, 0, 0, 1])
     assert (
         str(result)
         == """[
@@ -365,7 +382,7 @@ def test_cartographic_degrees_value():
     1.0
 ]"""
     )
-    result = CartographicDegreesValue(values=[0, 0, 1])
+    result = value_class(values=[0, 0, 1])
     assert (
         str(result)
         == """[
@@ -374,54 +391,93 @@ def test_cartographic_degrees_value():
     1.0
 ]"""
     )
-    result = CartographicDegreesValue()
+    result = value_class()
     assert str(result) == """[]"""
     with pytest.raises(TypeError):
-        CartographicDegreesValue(values=[0, 0, 1, 1, 1, 1])
+        value_class(values=[0, 0, 1, 1, 1, 1])
 
 
-def test_rgba_value():
-    assert (
-        str(RgbaValue(values=[30, 30, 30, 30]))
-        == """[
+@pytest.mark.parametrize(
+    "value_class, values, expected_result",
+    [
+        (
+            RgbaValue,
+            [30, 30, 30, 30],
+            """[
     30.0,
     30.0,
     30.0,
     30.0
-]"""
-    )
-    assert (
-        str(RgbaValue(values=[30, 30, 30, 30, 1]))
-        == """[
+]""",
+        ),
+        (
+            RgbaValue,
+            [30, 30, 30, 30, 1],
+            """[
     30.0,
     30.0,
     30.0,
     30.0,
     1.0
-]"""
-    )
-
-
-def test_rgbaf_value():
-    assert (
-        str(RgbafValue(values=[0.5, 0.5, 0.5, 0.5]))
-        == """[
+]""",
+        ),
+        (
+            RgbaValue,
+            [0, 1, 2, 3, 4, 300, 5, 6, 7, 8],
+            """[
+    0.0,
+    1.0,
+    2.0,
+    3.0,
+    4.0,
+    300.0,
+    5.0,
+    6.0,
+    7.0,
+    8.0
+]""",
+        ),
+        (
+            RgbafValue,
+            [0.5, 0.5, 0.5, 0.5],
+            """[
     0.5,
     0.5,
     0.5,
     0.5
-]"""
-    )
-    assert (
-        str(RgbafValue(values=[0.5, 0.5, 0.5, 0.5, 1]))
-        == """[
+]""",
+        ),
+        (
+            RgbafValue,
+            [0.5, 0.5, 0.5, 0.5, 1],
+            """[
     0.5,
     0.5,
     0.5,
     0.5,
     1.0
-]"""
-    )
+]""",
+        ),
+        (
+            RgbafValue,
+            [0, 0.1, 0.2, 0.3, 0.4, 2, 0.5, 0.6, 0.7, 0.8],
+            """[
+    0.0,
+    0.1,
+    0.2,
+    0.3,
+    0.4,
+    2.0,
+    0.5,
+    0.6,
+    0.7,
+    0.8
+]""",
+        ),
+    ],
+)
+def test_color_value(value_class, values, expected_result):
+    assert str(value_class(values=values)) == expected_result
 
 
 def test_check_reference():
@@ -432,3 +488,65 @@ def test_check_reference():
 
 def test_format_datetime_like():
     assert format_datetime_like(None) is None
+    assert (
+        format_datetime_like(dt.datetime(2019, 1, 1, 12, 30, 5, 250))
+        == "2019-01-01T12:30:05.000250Z"
+    )
+    assert format_datetime_like(dt.datetime(900, 1, 1)) == "0900-01-01T00:00:00.000000Z"
+
+
+def test_interval_value_formats_times_on_construction():
+    start = dt.datetime(2019, 1, 1, 12, tzinfo=dt.timezone.utc)
+    end = dt.datetime(2019, 9, 2, 21, 59, 59, tzinfo=dt.timezone.utc)
+
+    interval = IntervalValue(start=start, end=end, value=True)
+
+    assert interval.start == "2019-01-01T12:00:00.000000Z"
+    assert interval.end == "2019-09-02T21:59:59.000000Z"
+
+
+def test_interval_value_formats_times_assigned_after_construction():
+    interval = IntervalValue(
+        start="2019-01-01T12:00:00Z", end="2019-01-02T12:00:00Z", value=True
+    )
+    interval.start = dt.datetime(2020, 1, 1)
+    interval.end = dt.datetime(2020, 1, 2)
+
+    assert (
+        str(interval)
+        == """{
+    "interval": "2020-01-01T00:00:00.000000Z/2020-01-02T00:00:00.000000Z",
+    "boolean": true
+}"""
+    )
+
+    with pytest.raises(ValueError):
+        interval.end = "2019/01/01"
+
+
+@pytest.mark.parametrize(
+    "color, expected_result",
+    [
+        (0xFFCC00, [255, 204, 0, 255]),
+        (0xFFCC00FF, [255, 204, 0, 255]),
+        (0, [0, 0, 0, 255]),
+    ],
+)
+def test_get_color_from_int(color, expected_result):
+    assert get_color(color) == expected_result
+
+
+@pytest.mark.parametrize(
+    "color, message",
+    [
+        (-1, "Colour type not supported"),
+        (2**32, "Colour type not supported"),
+        ("#-1", "RGBA string not valid"),
+        ("#1ffffffff", "RGBA string not valid"),
+    ],
+)
+def test_get_color_out_of_range_raises_error(color, message):
+    with pytest.raises(TypeError) as excinfo:
+        get_color(color)
+
+    assert message in excinfo.exconly()